@@ -16,25 +16,243 @@ Target: DER < 0.01 (1%) with FEC recovery
 """
 
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
+import matplotlib
+matplotlib.use('Agg')  # Headless PNG output; pyplot is imported lazily for plotting
 import numpy as np
 import os
 import re
+import sys
+import io
+import contextlib
+import functools
+import hashlib
+import pickle
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:  # optional: fall back to the pandas C parser
+    pa = None
+
 # Configuration
 PLOT_DIR = "fec_analysis"
 PAPER_TARGET_DER = 1.0  # % (DER < 0.01 = 1%)
+GENERATION_SIZE_DEFAULT = 8  # packets per generation in the simulated FEC configuration
 EXPECTED_GENERATION_SIZES = [8, 16, 32, 64, 128]  # Common generation sizes
 EXPECTED_REDUNDANCY = 30  # % redundancy
 PACKET_INTERVAL = 144  # seconds (2.4 minutes)
 
+# Report row templates
+_ROW_FMT = "{:13d} | {:17d} | {:13.1f} | {}\n".format
+_QUALITY_FMT = "{}: {}\n".format
+
+# Overall FEC status keyed by (target met, any generations processed)
+FEC_STATUS = {
+    (True, True): ("✅ TARGET ACHIEVED", 'green'),
+    (True, False): ("✅ TARGET ACHIEVED", 'green'),
+    (False, True): ("🔧 FEC WORKING", 'orange'),
+    (False, False): ("❌ FEC NOT WORKING", 'red'),
+}
+
+CACHE_DIR = os.path.join(PLOT_DIR, '.cache')
+
+# All possible input files
+EXPECTED_FILES = {
+    'fec_performance': 'fec_performance.csv',
+    'main_simulation': 'paper_replication_adr_fec.csv', 
+    'radio_measurements': 'rssi_snr_measurements.csv',
+    'radio_summary': 'radio_measurement_summary.csv',
+    'fading_summary': 'fading_measurement_summary.csv',
+    'global_performance': 'paper_globalPerformance.txt',
+    'node_data': 'paper_nodeData.txt',
+    'phy_performance': 'paper_phyPerformance.txt'
+}
+
+# Column subsets and dtypes for large CSV inputs (other files use pandas defaults)
+CSV_SCHEMAS = {
+    'radio_measurements': (
+        ['Time', 'DeviceAddr', 'GatewayID', 'RSSI_dBm', 'SNR_dB'],
+        {'Time': 'float32', 'RSSI_dBm': 'float32', 'SNR_dB': 'float32'}
+    ),
+    'fec_performance': (
+        None,
+        # Small file: keep full precision so printed DER/improvement values round as in the CSV
+        {'Time': 'float64', 'PhysicalDER': 'float64',
+         'ApplicationDER': 'float64', 'FecImprovement': 'float64'}
+    ),
+}
+# Integer columns parsed as float, then cast once incomplete rows are dropped
+# (the simulator appends rows while running, so the last line may be partially written)
+INTEGER_COLUMNS = {
+    'radio_measurements': {'DeviceAddr': 'uint32', 'GatewayID': 'uint32'},
+    'fec_performance': {'GenerationsProcessed': 'int32', 'PacketsRecovered': 'int32'},
+}
+# Low-cardinality ID columns stored as pandas categoricals after parsing
+CATEGORICAL_COLUMNS = {
+    'radio_measurements': ['DeviceAddr', 'GatewayID'],
+}
+# CSV inputs mirrored to a Parquet sidecar so unchanged files are not re-parsed
+PARQUET_CACHED = ('fec_performance', 'radio_measurements')
+
 # Create output directory
 if not os.path.exists(PLOT_DIR):
     os.makedirs(PLOT_DIR)
 
+class _Tee(io.StringIO):
+    """Echo writes to the real stdout while keeping a copy for the cache."""
+    def __init__(self, stream):
+        super().__init__()
+        self.stream = stream
+    
+    def write(self, text):
+        self.stream.write(text)
+        return super().write(text)
+
+def cached_analysis(source):
+    """Memoize an analysis step on disk, keyed by the CSV version of the one input it reads."""
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(data):
+            frame = data[source]
+            source_stat = frame.attrs.get('source_stat') if frame is not None else None
+            if source_stat is None:
+                return func(data)  # Missing input: nothing worth caching
+            
+            # Console output is captured with the result and replayed on a hit
+            script = os.stat(os.path.abspath(__file__))
+            key = repr((EXPECTED_FILES[source], source_stat, script.st_mtime_ns, script.st_size,
+                        pd.__version__, np.__version__))
+            digest = hashlib.sha256(key.encode()).hexdigest()
+            cache_path = os.path.join(CACHE_DIR, f"{func.__name__}-{digest}.pkl")
+            if os.path.exists(cache_path):
+                try:
+                    with open(cache_path, 'rb') as f:
+                        output, result = pickle.load(f)
+                    sys.stdout.write(output)
+                    return result
+                except Exception:
+                    pass  # Unreadable or incompatible cache entry; recompute below
+            
+            tee = _Tee(sys.stdout)
+            with contextlib.redirect_stdout(tee):
+                result = func(data)
+            
+            # Replace stale entries for this step with the fresh result
+            try:
+                os.makedirs(CACHE_DIR, exist_ok=True)
+                for stale in Path(CACHE_DIR).glob(f"{func.__name__}-*.pkl"):
+                    stale.unlink()
+                with open(cache_path, 'wb') as f:
+                    pickle.dump((tee.getvalue(), result), f, protocol=pickle.HIGHEST_PROTOCOL)
+            except (OSError, pickle.PicklingError):
+                pass  # Cache is best-effort
+            return result
+        return wrapper
+    return decorate
+
+def read_csv_arrow(filename, usecols, dtypes):
+    """Parse a CSV with pyarrow's multithreaded reader into a pandas DataFrame."""
+    read_options = pa_csv.ReadOptions(use_threads=True, block_size=8 << 20)
+    # Skip a partially written trailing row, as the pandas parser tolerates it
+    parse_options = pa_csv.ParseOptions(invalid_row_handler=lambda row: 'skip')
+    convert_options = pa_csv.ConvertOptions(
+        include_columns=usecols,
+        column_types={col: pa.from_numpy_dtype(np.dtype(dt)) for col, dt in dtypes.items()}
+    )
+    table = pa_csv.read_csv(filename, read_options=read_options, parse_options=parse_options,
+                            convert_options=convert_options)
+    return table.to_pandas(split_blocks=True, self_destruct=True)
+
+def parquet_sidecar_path(key, filename, st):
+    """Sidecar path tagged with the parse schema and the CSV's (mtime, size) at parse time."""
+    schema = (CSV_SCHEMAS.get(key), INTEGER_COLUMNS.get(key), CATEGORICAL_COLUMNS.get(key))
+    tag = hashlib.sha256(repr((schema, st.st_mtime_ns, st.st_size)).encode()).hexdigest()[:16]
+    return f"{filename}.{tag}.parquet"
+
+def read_csv_cached(key, filename):
+    """Read a CSV input, reusing its Parquet sidecar while the CSV is unchanged."""
+    usecols, dtypes = CSV_SCHEMAS.get(key, (None, None))
+    # Stat before parsing: if the simulator appends mid-parse, the sidecar is keyed to the
+    # older version and misses on the next run instead of masking the new rows
+    st = os.stat(filename)
+    cache_path = parquet_sidecar_path(key, filename, st)
+    cacheable = pa is not None and key in PARQUET_CACHED
+    
+    if cacheable and os.path.exists(cache_path):
+        try:
+            df = pd.read_parquet(cache_path, columns=usecols)
+            df.attrs['source_stat'] = (st.st_mtime_ns, st.st_size)
+            return df
+        except (OSError, pa.ArrowInvalid, pa.ArrowTypeError):
+            pass  # Unreadable sidecar; re-parse the CSV below
+    
+    if key == 'radio_measurements' and pa is not None:
+        df = read_csv_arrow(filename, usecols, dtypes)
+    else:
+        df = pd.read_csv(filename, usecols=usecols, dtype=dtypes, engine='c')
+    int_dtypes = INTEGER_COLUMNS.get(key)
+    if int_dtypes:
+        df = df.dropna(subset=list(int_dtypes)).astype(int_dtypes)
+    for col in CATEGORICAL_COLUMNS.get(key, ()):
+        df[col] = df[col].astype('category')
+    
+    if cacheable:
+        try:
+            # Drop sidecars of older CSV versions or schemas
+            for stale in Path(filename).parent.glob(Path(filename).name + '*.parquet'):
+                if str(stale) != cache_path:
+                    stale.unlink()
+            df.to_parquet(cache_path, compression='zstd', engine='pyarrow')
+        except (OSError, pa.ArrowInvalid, pa.ArrowTypeError):
+            pass  # Cache is best-effort (e.g. read-only directory, unconvertible column)
+    # Identifies the CSV version these rows came from (keys the analysis cache)
+    df.attrs['source_stat'] = (st.st_mtime_ns, st.st_size)
+    return df
+
+def load_data_file(key, filename, size):
+    """Load one expected input file; returns (data, status, summary lines)."""
+    if size is None:
+        return None, "❌ Not found", [f"  {key:18}: Not found"]
+    if size == 0 and filename.endswith('.csv'):
+        return None, "❌ Empty file", [f"  {key:18}: Empty file"]
+    
+    try:
+        if filename.endswith('.csv'):
+            df = read_csv_cached(key, filename)
+            lines = [f"  {key:18}: {len(df)} entries"]
+            
+            # Show FEC-relevant columns for key files
+            if key == 'fec_performance' and len(df) > 0:
+                lines.append(f"    → Latest FEC: {df['GenerationsProcessed'].iat[-1]} gens, "
+                             f"{df['PacketsRecovered'].iat[-1]} recovered")
+            elif key == 'radio_measurements' and len(df) > 0:
+                devices = df['DeviceAddr'].nunique()
+                gateways = df['GatewayID'].nunique()
+                time_span = (df['Time'].max() - df['Time'].min()) / 3600
+                lines.append(f"    → {devices} devices, {gateways} gateways, {time_span:.1f}h span")
+            elif key == 'main_simulation' and len(df) > 0:
+                end_devices = df[df['Role'] == 'EndDevice'] if 'Role' in df.columns else df
+                if len(end_devices) > 0:
+                    if 'PDR' in end_devices.columns:
+                        pdr_col = end_devices['PDR']
+                        latest_pdr = pdr_col.iat[len(pdr_col) - 1]
+                    else:
+                        latest_pdr = 'N/A'
+                    lines.append(f"    → Latest PDR: {latest_pdr}")
+            
+            return df, f"✅ {len(df)} rows", lines
+        
+        # Text files are kept as raw content
+        with open(filename, 'r', encoding='utf-8') as f:
+            content = f.read()
+        return content, f"✅ {len(content)} chars", [f"  {key:18}: {len(content)} characters"]
+    
+    except Exception as e:
+        return None, f"❌ Error: {str(e)[:30]}", [f"  {key:18}: Error - {e}"]
+
 def load_all_data():
     """Load ALL available data files with FEC focus."""
     print("🔍 COMPREHENSIVE DATA LOADING (FEC-FOCUSED)")
@@ -43,63 +261,29 @@ def load_all_data():
     data = {}
     file_status = {}
     
-    # Define all possible files
-    expected_files = {
-        'fec_performance': 'fec_performance.csv',
-        'main_simulation': 'paper_replication_adr_fec.csv', 
-        'radio_measurements': 'rssi_snr_measurements.csv',
-        'radio_summary': 'radio_measurement_summary.csv',
-        'fading_summary': 'fading_measurement_summary.csv',
-        'global_performance': 'paper_globalPerformance.txt',
-        'node_data': 'paper_nodeData.txt',
-        'phy_performance': 'paper_phyPerformance.txt'
-    }
+    expected_files = EXPECTED_FILES
     
-    # Load each file with error handling
-    for key, filename in expected_files.items():
-        try:
-            if filename.endswith('.csv'):
-                df = pd.read_csv(filename)
-                data[key] = df
-                file_status[key] = f"✅ {len(df)} rows"
-                print(f"  {key:18}: {len(df)} entries")
-                
-                # Show FEC-relevant columns for key files
-                if key == 'fec_performance' and len(df) > 0:
-                    latest = df.iloc[-1]
-                    print(f"    → Latest FEC: {latest['GenerationsProcessed']} gens, "
-                          f"{latest['PacketsRecovered']} recovered")
-                elif key == 'radio_measurements' and len(df) > 0:
-                    devices = df['DeviceAddr'].nunique()
-                    gateways = df['GatewayID'].nunique()
-                    time_span = (df['Time'].max() - df['Time'].min()) / 3600
-                    print(f"    → {devices} devices, {gateways} gateways, {time_span:.1f}h span")
-                elif key == 'main_simulation' and len(df) > 0:
-                    end_devices = df[df['Role'] == 'EndDevice'] if 'Role' in df.columns else df
-                    if len(end_devices) > 0:
-                        latest_pdr = end_devices['PDR'].iloc[-1] if 'PDR' in end_devices.columns else 'N/A'
-                        print(f"    → Latest PDR: {latest_pdr}")
-                        
-            elif filename.endswith('.txt'):
-                # Try to read text files
-                if os.path.exists(filename):
-                    with open(filename, 'r') as f:
-                        content = f.read()
-                    data[key] = content
-                    file_status[key] = f"✅ {len(content)} chars"
-                    print(f"  {key:18}: {len(content)} characters")
-                else:
-                    data[key] = None
-                    file_status[key] = "❌ Not found"
-                    
-        except Exception as e:
-            data[key] = None
-            file_status[key] = f"❌ Error: {str(e)[:30]}"
-            print(f"  {key:18}: Error - {e}")
+    # One directory snapshot instead of probing each expected file
+    present = {entry.name: entry.stat().st_size for entry in os.scandir('.') if entry.is_file()}
+    
+    # Load files concurrently (CSV parsing and file reads release the GIL),
+    # then report them in the original order
+    with ThreadPoolExecutor(max_workers=min(8, len(expected_files))) as executor:
+        results = list(executor.map(
+            lambda item: load_data_file(item[0], item[1], present.get(item[1])),
+            expected_files.items()
+        ))
+    
+    for key, (value, status, summary_lines) in zip(expected_files, results):
+        data[key] = value
+        file_status[key] = status
+        for line in summary_lines:
+            print(line)
     
     print(f"\n📊 Data Loading Summary: {sum(1 for v in data.values() if v is not None)}/{len(expected_files)} files loaded")
     return data, file_status
 
+@cached_analysis('radio_measurements')
 def analyze_fec_packet_flow(data):
     """Deep analysis of FEC packet flow and generation timing."""
     print("\n🔍 FEC PACKET FLOW ANALYSIS")
@@ -115,7 +299,8 @@ def analyze_fec_packet_flow(data):
     # Basic packet flow
     total_measurements = len(radio_data)
     unique_devices = radio_data['DeviceAddr'].nunique()
-    unique_gateways = radio_data['GatewayID'].nunique()
+    gateway_groups = radio_data.groupby('GatewayID', sort=True, observed=True)
+    unique_gateways = gateway_groups.ngroups
     time_span_hours = (radio_data['Time'].max() - radio_data['Time'].min()) / 3600
     
     # Estimate unique packets (accounting for multiple gateway receptions)
@@ -153,14 +338,17 @@ def analyze_fec_packet_flow(data):
     print(f"\n🔧 Generation Size Analysis:")
     generation_analysis = {}
     
-    for gen_size in EXPECTED_GENERATION_SIZES:
-        possible_generations = estimated_unique_packets // gen_size
-        time_per_generation_hours = (gen_size * PACKET_INTERVAL) / 3600
-        
+    sizes = np.array(EXPECTED_GENERATION_SIZES, dtype=np.int64)
+    possible = estimated_unique_packets // sizes
+    time_per_gen_hours = sizes * PACKET_INTERVAL / 3600.0
+    fits = (possible > 0) & (time_per_gen_hours <= time_span_hours)
+    
+    for gen_size, possible_generations, time_per_generation_hours, would_complete in zip(
+            EXPECTED_GENERATION_SIZES, possible.tolist(), time_per_gen_hours.tolist(), fits.tolist()):
         generation_analysis[gen_size] = {
             'possible_complete_generations': possible_generations,
             'time_per_generation_hours': time_per_generation_hours,
-            'would_complete_in_timespan': possible_generations > 0 and time_per_generation_hours <= time_span_hours
+            'would_complete_in_timespan': would_complete
         }
         
         status = "✅" if possible_generations > 0 else "❌"
@@ -168,6 +356,11 @@ def analyze_fec_packet_flow(data):
               f"({time_per_generation_hours:.1f}h each)")
     
     analysis['generation_analysis'] = generation_analysis
+    analysis['generation_sizes_sorted'] = sorted(generation_analysis)
+    gen_arr = np.empty(len(sizes), dtype=[('size', 'i4'), ('n', 'i4')])
+    gen_arr['size'] = sizes
+    gen_arr['n'] = possible
+    analysis['gen_arr'] = gen_arr
     
     # Identify optimal generation size
     optimal_sizes = [size for size, info in generation_analysis.items() 
@@ -185,6 +378,7 @@ def analyze_fec_packet_flow(data):
     
     return analysis
 
+@cached_analysis('fec_performance')
 def analyze_fec_performance_deep(data):
     """Deep analysis of FEC performance data."""
     print("\n🔍 DEEP FEC PERFORMANCE ANALYSIS")
@@ -204,19 +398,20 @@ def analyze_fec_performance_deep(data):
     
     # Time series analysis
     if 'Time' in fec_data.columns:
-        fec_data['TimeHours'] = fec_data['Time'] / 3600
-        analysis['time_span'] = fec_data['TimeHours'].max() - fec_data['TimeHours'].min()
+        time_hours = fec_data['Time'].to_numpy() * (1.0 / 3600.0)
+        analysis['time_hours'] = time_hours
+        analysis['time_span'] = time_hours.max() - time_hours.min()
         analysis['measurement_count'] = len(fec_data)
         analysis['measurement_frequency'] = analysis['time_span'] / analysis['measurement_count'] if analysis['measurement_count'] > 1 else 0
     
-    # Latest performance
-    latest = fec_data.iloc[-1]
+    # Latest performance (plain scalars, keeping each column's dtype)
+    last = {col: fec_data[col].iat[-1] for col in fec_data.columns}
     analysis['latest'] = {
-        'physical_der_percent': latest['PhysicalDER'] * 100,
-        'application_der_percent': latest['ApplicationDER'] * 100,
-        'improvement_factor': latest['FecImprovement'],
-        'generations_processed': latest['GenerationsProcessed'],
-        'packets_recovered': latest['PacketsRecovered']
+        'physical_der_percent': last['PhysicalDER'] * 100,
+        'application_der_percent': last['ApplicationDER'] * 100,
+        'improvement_factor': last['FecImprovement'],
+        'generations_processed': last['GenerationsProcessed'],
+        'packets_recovered': last['PacketsRecovered']
     }
     
     print(f"📊 Performance Trends:")
@@ -230,10 +425,11 @@ def analyze_fec_performance_deep(data):
     
     # Trend analysis
     if len(fec_data) > 1:
-        # DER trends
-        der_physical_trend = np.polyfit(range(len(fec_data)), fec_data['PhysicalDER'], 1)[0]
-        der_app_trend = np.polyfit(range(len(fec_data)), fec_data['ApplicationDER'], 1)[0]
-        improvement_trend = np.polyfit(range(len(fec_data)), fec_data['FecImprovement'], 1)[0]
+        # DER trends (one least-squares solve for all three series)
+        x = np.arange(len(fec_data), dtype=np.float64)
+        A = np.vstack([x, np.ones_like(x)]).T
+        Y = fec_data[['PhysicalDER', 'ApplicationDER', 'FecImprovement']].to_numpy(dtype=np.float64)
+        der_physical_trend, der_app_trend, improvement_trend = np.linalg.lstsq(A, Y, rcond=None)[0][0]
         
         analysis['trends'] = {
             'physical_der_slope': der_physical_trend,
@@ -318,7 +514,7 @@ def diagnose_fec_issues_comprehensive(data, packet_analysis, performance_analysi
         recommendations.append("2. Verify redundant packet generation")
         recommendations.append("3. Check if packet losses match FEC capability")
     elif packets_recovered > 0:
-        recovery_rate = packets_recovered / (generations_processed * 8) if generations_processed > 0 else 0
+        recovery_rate = packets_recovered / (generations_processed * GENERATION_SIZE_DEFAULT) if generations_processed > 0 else 0
         print(f"✅ Packets recovered: {packets_recovered} ({recovery_rate:.1%} of generation capacity)")
     
     # Check 4: Performance targets
@@ -368,6 +564,8 @@ def diagnose_fec_issues_comprehensive(data, packet_analysis, performance_analysi
 
 def create_comprehensive_fec_plots(data, packet_analysis, performance_analysis):
     """Create comprehensive FEC visualization."""
+    import matplotlib.pyplot as plt
+    
     print("\n📊 GENERATING COMPREHENSIVE FEC PLOTS")
     print("=" * 60)
     
@@ -381,52 +579,59 @@ def create_comprehensive_fec_plots(data, packet_analysis, performance_analysis):
     # 1. Packet Flow Timeline (full width, top)
     ax1 = fig.add_subplot(gs[0, :])
     if data['radio_measurements'] is not None:
-        radio_data = data['radio_measurements'].copy()
-        radio_data['TimeHours'] = radio_data['Time'] / 3600
+        radio_data = data['radio_measurements']
         
-        # Plot packet receptions by gateway
-        for gw_id in sorted(radio_data['GatewayID'].unique()):
-            gw_data = radio_data[radio_data['GatewayID'] == gw_id]
-            ax1.scatter(gw_data['TimeHours'], [gw_id] * len(gw_data), 
-                       alpha=0.6, s=10, label=f'Gateway {gw_id}')
+        # A header-only file (first reporting interval) leaves the axes empty
+        if len(radio_data) > 0:
+            time_hours = radio_data['Time'].to_numpy() * (1.0 / 3600.0)
+            
+            # Bin receptions into ~1h x gateway cells instead of one marker per packet
+            gw_codes, gw_ids = pd.factorize(radio_data['GatewayID'], sort=True)
+            t_min, t_max = time_hours.min(), time_hours.max()
+            time_bins = max(1, int(np.ceil(t_max - t_min)))
+            n_gateways = len(gw_ids)
+            counts, xedges, _ = np.histogram2d(time_hours, gw_codes, bins=[time_bins, n_gateways],
+                                               range=[[t_min, t_max], [-0.5, n_gateways - 0.5]])
+            
+            heatmap = ax1.imshow(counts.T, aspect='auto', origin='lower', cmap='viridis',
+                                 interpolation='nearest', rasterized=True,
+                                 extent=[xedges[0], xedges[-1], -0.5, n_gateways - 0.5])
+            fig.colorbar(heatmap, ax=ax1, label='Receptions per time bin')
+            ax1.set_yticks(range(n_gateways))
+            ax1.set_yticklabels(gw_ids)
         
         ax1.set_xlabel('Time (hours)')
         ax1.set_ylabel('Gateway ID')
         ax1.set_title('Packet Reception Timeline by Gateway')
-        ax1.legend(bbox_to_anchor=(1.05, 1), loc='upper left')
-        ax1.grid(True, alpha=0.3)
     
     # 2. Generation Size Analysis
     ax2 = fig.add_subplot(gs[1, 0])
-    if 'generation_analysis' in packet_analysis:
-        gen_analysis = packet_analysis['generation_analysis']
-        sizes = list(gen_analysis.keys())
-        completions = [gen_analysis[size]['possible_complete_generations'] for size in sizes]
+    if 'gen_arr' in packet_analysis:
+        gen_arr = packet_analysis['gen_arr']
+        completions = gen_arr['n']
+        positions = np.arange(len(gen_arr))
         
-        colors = ['green' if c > 0 else 'red' for c in completions]
-        bars = ax2.bar(range(len(sizes)), completions, color=colors, alpha=0.7)
-        ax2.set_xticks(range(len(sizes)))
-        ax2.set_xticklabels(sizes)
+        colors = np.where(completions > 0, 'green', 'red')
+        bars = ax2.bar(positions, completions, color=colors, alpha=0.7)
+        ax2.set_xticks(positions)
+        ax2.set_xticklabels(gen_arr['size'])
         ax2.set_xlabel('Generation Size (packets)')
         ax2.set_ylabel('Possible Complete Generations')
         ax2.set_title('Generation Size Feasibility')
         
-        # Add value labels
-        for bar, val in zip(bars, completions):
-            if val > 0:
-                ax2.text(bar.get_x() + bar.get_width()/2, bar.get_height(), 
-                        str(val), ha='center', va='bottom', fontweight='bold')
+        # Add value labels (feasible sizes only)
+        ax2.bar_label(bars, labels=[str(val) if val > 0 else '' for val in completions],
+                      fontweight='bold')
     
     # 3. DER Performance Comparison
     ax3 = fig.add_subplot(gs[1, 1])
-    if data['fec_performance'] is not None and len(data['fec_performance']) > 0:
-        fec_data = data['fec_performance']
-        latest = fec_data.iloc[-1]
+    if 'latest' in performance_analysis:
+        latest_perf = performance_analysis['latest']
         
         categories = ['Physical\nDER', 'Application\nDER', 'Target\nDER']
         values = [
-            latest['PhysicalDER'] * 100,
-            latest['ApplicationDER'] * 100,
+            latest_perf['physical_der_percent'],
+            latest_perf['application_der_percent'],
             PAPER_TARGET_DER
         ]
         colors = ['red', 'blue', 'green']
@@ -436,9 +641,7 @@ def create_comprehensive_fec_plots(data, packet_analysis, performance_analysis):
         ax3.set_title('DER Performance vs Target')
         
         # Add value labels
-        for bar, val in zip(bars, values):
-            ax3.text(bar.get_x() + bar.get_width()/2, bar.get_height(), 
-                    f'{val:.2f}%', ha='center', va='bottom', fontweight='bold')
+        ax3.bar_label(bars, fmt='%.2f%%', fontweight='bold')
         
         # Add target line
         ax3.axhline(y=PAPER_TARGET_DER, color='green', linestyle='--', alpha=0.5)
@@ -460,9 +663,7 @@ def create_comprehensive_fec_plots(data, packet_analysis, performance_analysis):
         ax4.set_title('FEC System Activity')
         
         # Add value labels
-        for bar, val in zip(bars, values):
-            ax4.text(bar.get_x() + bar.get_width()/2, bar.get_height(), 
-                    str(int(val)), ha='center', va='bottom', fontweight='bold')
+        ax4.bar_label(bars, labels=[str(int(val)) for val in values], fontweight='bold')
         
         # Status indicator
         if latest_perf['generations_processed'] == 0:
@@ -477,12 +678,11 @@ def create_comprehensive_fec_plots(data, packet_analysis, performance_analysis):
     
     # 5. Improvement Factor
     ax5 = fig.add_subplot(gs[1, 3])
-    if data['fec_performance'] is not None and len(data['fec_performance']) > 0:
+    if 'time_hours' in performance_analysis:
         fec_data = data['fec_performance']
-        if 'TimeHours' not in fec_data.columns:
-            fec_data['TimeHours'] = fec_data['Time'] / 3600
+        time_hours = performance_analysis['time_hours']
         
-        ax5.plot(fec_data['TimeHours'], fec_data['FecImprovement'], 'o-', linewidth=2, markersize=6)
+        ax5.plot(time_hours, fec_data['FecImprovement'], 'o-', linewidth=2, markersize=6)
         ax5.set_xlabel('Time (hours)')
         ax5.set_ylabel('FEC Improvement Factor')
         ax5.set_title('FEC Improvement Over Time')
@@ -493,14 +693,13 @@ def create_comprehensive_fec_plots(data, packet_analysis, performance_analysis):
     
     # 6. DER Evolution (bottom left)
     ax6 = fig.add_subplot(gs[2, :2])
-    if data['fec_performance'] is not None and len(data['fec_performance']) > 0:
+    if 'time_hours' in performance_analysis:
         fec_data = data['fec_performance']
-        if 'TimeHours' not in fec_data.columns:
-            fec_data['TimeHours'] = fec_data['Time'] / 3600
+        time_hours = performance_analysis['time_hours']
         
-        ax6.plot(fec_data['TimeHours'], fec_data['PhysicalDER'] * 100, 
+        ax6.plot(time_hours, fec_data['PhysicalDER'] * 100, 
                 'r-o', label='Physical DER', linewidth=2, markersize=4)
-        ax6.plot(fec_data['TimeHours'], fec_data['ApplicationDER'] * 100, 
+        ax6.plot(time_hours, fec_data['ApplicationDER'] * 100, 
                 'b-o', label='Application DER (with FEC)', linewidth=2, markersize=4)
         ax6.axhline(y=PAPER_TARGET_DER, color='green', linestyle='--', 
                    label=f'Target DER ({PAPER_TARGET_DER}%)', alpha=0.7)
@@ -523,15 +722,10 @@ def create_comprehensive_fec_plots(data, packet_analysis, performance_analysis):
         latest_perf = performance_analysis['latest']
         
         # Overall status
-        if latest_perf['application_der_percent'] < PAPER_TARGET_DER:
-            status = "✅ TARGET ACHIEVED"
-            status_color = 'green'
-        elif latest_perf['generations_processed'] > 0:
-            status = "🔧 FEC WORKING"
-            status_color = 'orange'
-        else:
-            status = "❌ FEC NOT WORKING"
-            status_color = 'red'
+        status, status_color = FEC_STATUS[(
+            bool(latest_perf['application_der_percent'] < PAPER_TARGET_DER),
+            bool(latest_perf['generations_processed'] > 0)
+        )]
         
         status_text += f"Status: {status}\n\n"
         
@@ -570,184 +764,211 @@ def create_comprehensive_fec_plots(data, packet_analysis, performance_analysis):
             verticalalignment='top', fontfamily='monospace',
             bbox=dict(boxstyle='round,pad=0.5', facecolor='lightblue', alpha=0.3))
     
-    plt.savefig(os.path.join(PLOT_DIR, 'comprehensive_fec_analysis.png'), 
-                dpi=150, bbox_inches='tight')
-    plt.close()
+    fig.savefig(os.path.join(PLOT_DIR, 'comprehensive_fec_analysis.png'), 
+                dpi=150, bbox_inches=None,
+                pil_kwargs={'optimize': True, 'compress_level': 6})
+    plt.close(fig)
     print(f"  → Generated: {PLOT_DIR}/comprehensive_fec_analysis.png")
 
-def generate_detailed_fec_report(data, packet_analysis, performance_analysis, issues, recommendations):
+_RULE = "=" * 80
+
+# Static report skeleton, rendered once per run with str.format_map
+_REPORT_TMPL = f"""{_RULE}
+COMPREHENSIVE FEC SYSTEM ANALYSIS REPORT
+DaRe FEC Implementation in LoRaWAN ADRopt Simulation
+Generated: {{generated}}
+{_RULE}
+
+EXECUTIVE SUMMARY
+{"-" * 40}
+{{summary_block}}
+Issues Identified: {{issue_count}}
+Recommendations: {{recommendation_count}}
+
+DETAILED TECHNICAL ANALYSIS
+{"-" * 40}
+
+1. PACKET FLOW ANALYSIS
+{"-" * 25}
+{{packet_flow_block}}
+2. GENERATION SIZE ANALYSIS
+{"-" * 28}
+{{generation_block}}
+3. FEC PERFORMANCE ANALYSIS
+{"-" * 29}
+{{performance_block}}
+4. ISSUES AND RECOMMENDATIONS
+{"-" * 31}
+ISSUES IDENTIFIED:
+{{issues_block}}
+RECOMMENDATIONS:
+{{recommendations_block}}
+5. IMPLEMENTATION GUIDELINES
+{"-" * 30}
+For immediate testing (short simulations):
+• Use generation size: {GENERATION_SIZE_DEFAULT} packets
+• Use redundancy ratio: 50%
+• Minimum simulation time: ~20 minutes
+• Expected FEC activity: Within first generation
+
+For realistic deployment (long simulations):
+• Use generation size: 128 packets
+• Use redundancy ratio: 30%
+• Minimum simulation time: 24+ hours
+• Expected FEC activity: After several hours
+
+Performance optimization:
+• Monitor generation completion rate
+• Adjust redundancy based on channel conditions
+• Consider adaptive generation sizes
+• Implement smart recovery algorithms
+
+6. DATA QUALITY ASSESSMENT
+{"-" * 28}
+{{data_quality_block}}
+Overall data completeness: {{data_completeness:.1%}}
+
+{_RULE}
+END OF REPORT
+{_RULE}
+"""
+
+def report_summary_block(performance_analysis: dict) -> str:
+    """Executive summary status line and key metrics."""
+    if 'latest' not in performance_analysis:
+        return ""
+    
+    latest = performance_analysis['latest']
+    app_der = latest['application_der_percent']
+    gens = latest['generations_processed']
+    rec = latest['packets_recovered']
+    imp = latest['improvement_factor']
+    
+    if app_der < PAPER_TARGET_DER:
+        status = "✅ SUCCESS: FEC system meeting paper's DER < 1% target"
+    elif gens > 0:
+        status = "🔧 PARTIAL SUCCESS: FEC working but not meeting target"
+    else:
+        status = "❌ FAILURE: FEC system not operational"
+    
+    return (f"{status}\n"
+            f"\nKey Metrics:\n"
+            f"• Application DER: {app_der:.2f}% (target: <{PAPER_TARGET_DER}%)\n"
+            f"• FEC Improvement: {imp:.1f}x\n"
+            f"• Generations Processed: {gens}\n"
+            f"• Packets Recovered: {rec}\n")
+
+def report_packet_flow_block(packet_analysis: dict) -> str:
+    """Radio measurement statistics and packet rates."""
+    if 'basic_stats' not in packet_analysis:
+        return ""
+    
+    stats = packet_analysis['basic_stats']
+    block = (f"Total radio measurements: {stats['total_measurements']}\n"
+             f"Unique devices: {stats['unique_devices']}\n"
+             f"Unique gateways: {stats['unique_gateways']}\n"
+             f"Simulation time span: {stats['time_span_hours']:.2f} hours\n"
+             f"Estimated unique packets: {stats['estimated_unique_packets']}\n")
+    
+    if 'packet_rates' in packet_analysis:
+        rates = packet_analysis['packet_rates']
+        block += (f"Actual packet rate: {rates['actual_rate']:.1f} packets/hour\n"
+                  f"Expected packet rate: {rates['expected_rate']:.1f} packets/hour\n"
+                  f"Rate efficiency: {rates['rate_ratio']:.1%}\n")
+    return block
+
+def report_generation_block(packet_analysis: dict) -> str:
+    """Generation size feasibility table and recommendation."""
+    if 'generation_analysis' not in packet_analysis:
+        return ""
+    
+    gen_analysis = packet_analysis['generation_analysis']
+    rows = ["Generation Size | Possible Completions | Time per Gen (h) | Feasible\n",
+            "-" * 65 + "\n"]
+    for size in packet_analysis.get('generation_sizes_sorted') or sorted(gen_analysis):
+        info = gen_analysis[size]
+        pc = info['possible_complete_generations']
+        feasible = "✅" if pc > 0 else "❌"
+        rows.append(_ROW_FMT(size, pc, info['time_per_generation_hours'], feasible))
+    
+    optimal = packet_analysis.get('optimal_generation_size')
+    if optimal:
+        rows.append(f"\nRecommended generation size: {optimal} packets\n")
+    else:
+        rows.append(f"\nWARNING: No generation size feasible with current simulation\n")
+    return "".join(rows)
+
+def report_performance_block(performance_analysis: dict) -> str:
+    """Latest DER/recovery figures and distance to the paper target."""
+    if 'latest' not in performance_analysis:
+        return ""
+    
+    latest = performance_analysis['latest']
+    app_der = latest['application_der_percent']
+    gens = latest['generations_processed']
+    rec = latest['packets_recovered']
+    phys_der = latest['physical_der_percent']
+    imp = latest['improvement_factor']
+    block = (f"Physical layer DER: {phys_der:.4f}%\n"
+             f"Application layer DER: {app_der:.4f}%\n"
+             f"FEC improvement factor: {imp:.2f}x\n"
+             f"Generations processed: {gens}\n"
+             f"Packets recovered: {rec}\n")
+    
+    if gens > 0:
+        recovery_rate = rec / (gens * GENERATION_SIZE_DEFAULT)
+        block += f"Recovery rate: {recovery_rate:.1%} of generation capacity\n"
+    
+    # Target analysis (computed once in analyze_fec_performance_deep)
+    target_achievement = performance_analysis['target_achievement']
+    target_gap = target_achievement['target_gap']
+    if target_gap <= 0:
+        block += f"✅ Target achieved with {abs(target_gap):.2f}% margin\n"
+    else:
+        needed_improvement = target_achievement['improvement_needed']
+        block += (f"❌ Target missed by {target_gap:.2f} percentage points\n"
+                  f"Need {needed_improvement:.1f}x better performance to meet target\n")
+    return block
+
+def report_numbered_block(items: list[str], empty_message: str) -> str:
+    """Numbered list of issues or recommendations."""
+    if not items:
+        return empty_message + "\n"
+    return "".join(f"{i:2d}. {item}\n" for i, item in enumerate(items, 1))
+
+def report_data_quality_block(data: dict) -> str:
+    """Per-input availability markers for the headline data sources."""
+    data_quality = {key: '✅' if data[key] is not None else '❌'
+                    for key in ('fec_performance', 'radio_measurements', 'main_simulation')}
+    return "".join(_QUALITY_FMT(key, status) for key, status in data_quality.items())
+
+def generate_detailed_fec_report(data: dict, packet_analysis: dict, performance_analysis: dict,
+                                 issues: list[str], recommendations: list[str]) -> None:
     """Generate comprehensive FEC report."""
     print("\n📋 GENERATING DETAILED FEC REPORT")
     print("=" * 60)
     
     report_path = os.path.join(PLOT_DIR, 'detailed_fec_report.txt')
     
-    with open(report_path, 'w') as f:
-        f.write("=" * 80 + "\n")
-        f.write("COMPREHENSIVE FEC SYSTEM ANALYSIS REPORT\n")
-        f.write("DaRe FEC Implementation in LoRaWAN ADRopt Simulation\n")
-        f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        f.write("=" * 80 + "\n\n")
-        
-        # Executive Summary
-        f.write("EXECUTIVE SUMMARY\n")
-        f.write("-" * 40 + "\n")
-        
-        if 'latest' in performance_analysis:
-            latest = performance_analysis['latest']
-            target_met = latest['application_der_percent'] < PAPER_TARGET_DER
-            
-            if target_met:
-                f.write("✅ SUCCESS: FEC system meeting paper's DER < 1% target\n")
-            elif latest['generations_processed'] > 0:
-                f.write("🔧 PARTIAL SUCCESS: FEC working but not meeting target\n")
-            else:
-                f.write("❌ FAILURE: FEC system not operational\n")
-            
-            f.write(f"\nKey Metrics:\n")
-            f.write(f"• Application DER: {latest['application_der_percent']:.2f}% (target: <{PAPER_TARGET_DER}%)\n")
-            f.write(f"• FEC Improvement: {latest['improvement_factor']:.1f}x\n")
-            f.write(f"• Generations Processed: {latest['generations_processed']}\n")
-            f.write(f"• Packets Recovered: {latest['packets_recovered']}\n")
-        
-        f.write(f"\nIssues Identified: {len(issues)}\n")
-        f.write(f"Recommendations: {len(recommendations)}\n\n")
-        
-        # Detailed Analysis
-        f.write("DETAILED TECHNICAL ANALYSIS\n")
-        f.write("-" * 40 + "\n\n")
-        
-        # Packet Flow Analysis
-        f.write("1. PACKET FLOW ANALYSIS\n")
-        f.write("-" * 25 + "\n")
-        
-        if 'basic_stats' in packet_analysis:
-            stats = packet_analysis['basic_stats']
-            f.write(f"Total radio measurements: {stats['total_measurements']}\n")
-            f.write(f"Unique devices: {stats['unique_devices']}\n")
-            f.write(f"Unique gateways: {stats['unique_gateways']}\n")
-            f.write(f"Simulation time span: {stats['time_span_hours']:.2f} hours\n")
-            f.write(f"Estimated unique packets: {stats['estimated_unique_packets']}\n")
-            
-            if 'packet_rates' in packet_analysis:
-                rates = packet_analysis['packet_rates']
-                f.write(f"Actual packet rate: {rates['actual_rate']:.1f} packets/hour\n")
-                f.write(f"Expected packet rate: {rates['expected_rate']:.1f} packets/hour\n")
-                f.write(f"Rate efficiency: {rates['rate_ratio']:.1%}\n")
-        
-        f.write("\n")
-        
-        # Generation Analysis
-        f.write("2. GENERATION SIZE ANALYSIS\n")
-        f.write("-" * 28 + "\n")
-        
-        if 'generation_analysis' in packet_analysis:
-            gen_analysis = packet_analysis['generation_analysis']
-            f.write("Generation Size | Possible Completions | Time per Gen (h) | Feasible\n")
-            f.write("-" * 65 + "\n")
-            
-            for size in sorted(gen_analysis.keys()):
-                info = gen_analysis[size]
-                feasible = "✅" if info['possible_complete_generations'] > 0 else "❌"
-                f.write(f"{size:13d} | {info['possible_complete_generations']:17d} | "
-                       f"{info['time_per_generation_hours']:13.1f} | {feasible}\n")
-            
-            optimal = packet_analysis.get('optimal_generation_size')
-            if optimal:
-                f.write(f"\nRecommended generation size: {optimal} packets\n")
-            else:
-                f.write(f"\nWARNING: No generation size feasible with current simulation\n")
-        
-        f.write("\n")
-        
-        # Performance Analysis
-        f.write("3. FEC PERFORMANCE ANALYSIS\n")
-        f.write("-" * 29 + "\n")
-        
-        if 'latest' in performance_analysis:
-            latest = performance_analysis['latest']
-            f.write(f"Physical layer DER: {latest['physical_der_percent']:.4f}%\n")
-            f.write(f"Application layer DER: {latest['application_der_percent']:.4f}%\n")
-            f.write(f"FEC improvement factor: {latest['improvement_factor']:.2f}x\n")
-            f.write(f"Generations processed: {latest['generations_processed']}\n")
-            f.write(f"Packets recovered: {latest['packets_recovered']}\n")
-            
-            if latest['generations_processed'] > 0:
-                recovery_rate = latest['packets_recovered'] / (latest['generations_processed'] * 8)
-                f.write(f"Recovery rate: {recovery_rate:.1%} of generation capacity\n")
-            
-            # Target analysis
-            target_gap = latest['application_der_percent'] - PAPER_TARGET_DER
-            if target_gap <= 0:
-                f.write(f"✅ Target achieved with {abs(target_gap):.2f}% margin\n")
-            else:
-                f.write(f"❌ Target missed by {target_gap:.2f} percentage points\n")
-                needed_improvement = PAPER_TARGET_DER / latest['application_der_percent']
-                f.write(f"Need {needed_improvement:.1f}x better performance to meet target\n")
-        
-        f.write("\n")
-        
-        # Issues and Recommendations
-        f.write("4. ISSUES AND RECOMMENDATIONS\n")
-        f.write("-" * 31 + "\n")
-        
-        f.write("ISSUES IDENTIFIED:\n")
-        if issues:
-            for i, issue in enumerate(issues, 1):
-                f.write(f"{i:2d}. {issue}\n")
-        else:
-            f.write("No critical issues identified.\n")
-        
-        f.write("\nRECOMMENDATIONS:\n")
-        if recommendations:
-            for i, rec in enumerate(recommendations, 1):
-                f.write(f"{i:2d}. {rec}\n")
-        else:
-            f.write("No specific recommendations - system performing well.\n")
-        
-        f.write("\n")
-        
-        # Implementation Guidelines
-        f.write("5. IMPLEMENTATION GUIDELINES\n")
-        f.write("-" * 30 + "\n")
-        
-        f.write("For immediate testing (short simulations):\n")
-        f.write("• Use generation size: 8 packets\n")
-        f.write("• Use redundancy ratio: 50%\n")
-        f.write("• Minimum simulation time: ~20 minutes\n")
-        f.write("• Expected FEC activity: Within first generation\n\n")
-        
-        f.write("For realistic deployment (long simulations):\n")
-        f.write("• Use generation size: 128 packets\n")
-        f.write("• Use redundancy ratio: 30%\n")
-        f.write("• Minimum simulation time: 24+ hours\n")
-        f.write("• Expected FEC activity: After several hours\n\n")
-        
-        f.write("Performance optimization:\n")
-        f.write("• Monitor generation completion rate\n")
-        f.write("• Adjust redundancy based on channel conditions\n")
-        f.write("• Consider adaptive generation sizes\n")
-        f.write("• Implement smart recovery algorithms\n\n")
-        
-        # Data Quality Assessment
-        f.write("6. DATA QUALITY ASSESSMENT\n")
-        f.write("-" * 28 + "\n")
-        
-        data_quality = {
-            'fec_performance': '✅' if data['fec_performance'] is not None else '❌',
-            'radio_measurements': '✅' if data['radio_measurements'] is not None else '❌',
-            'main_simulation': '✅' if data['main_simulation'] is not None else '❌'
-        }
-        
-        for key, status in data_quality.items():
-            f.write(f"{key}: {status}\n")
-        
-        data_completeness = sum(1 for v in data.values() if v is not None) / len(data)
-        f.write(f"\nOverall data completeness: {data_completeness:.1%}\n")
-        
-        f.write("\n" + "=" * 80 + "\n")
-        f.write("END OF REPORT\n")
-        f.write("=" * 80 + "\n")
+    # Completeness covers every expected input file, not just the three in the quality block
+    data_completeness = len([v for v in data.values() if v is not None]) / len(data)
+    
+    ctx = {
+        'generated': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'summary_block': report_summary_block(performance_analysis),
+        'issue_count': len(issues),
+        'recommendation_count': len(recommendations),
+        'packet_flow_block': report_packet_flow_block(packet_analysis),
+        'generation_block': report_generation_block(packet_analysis),
+        'performance_block': report_performance_block(performance_analysis),
+        'issues_block': report_numbered_block(issues, "No critical issues identified."),
+        'recommendations_block': report_numbered_block(
+            recommendations, "No specific recommendations - system performing well."),
+        'data_quality_block': report_data_quality_block(data),
+        'data_completeness': data_completeness,
+    }
+    
+    Path(report_path).write_text(_REPORT_TMPL.format_map(ctx), encoding='utf-8')
     
     print(f"  → Generated: {report_path}")
 
@@ -783,14 +1004,17 @@ def main():
     
     if 'latest' in performance_analysis:
         latest = performance_analysis['latest']
+        app_der = latest['application_der_percent']
+        gens = latest['generations_processed']
+        rec = latest['packets_recovered']
         
         print(f"\n📊 Current Status:")
-        print(f"   Application DER: {latest['application_der_percent']:.2f}% (target: <{PAPER_TARGET_DER}%)")
-        print(f"   Generations Processed: {latest['generations_processed']}")
-        print(f"   Packets Recovered: {latest['packets_recovered']}")
+        print(f"   Application DER: {app_der:.2f}% (target: <{PAPER_TARGET_DER}%)")
+        print(f"   Generations Processed: {gens}")
+        print(f"   Packets Recovered: {rec}")
         
         # Primary recommendation
-        if latest['generations_processed'] == 0:
+        if gens == 0:
             print(f"\n🚨 PRIMARY ISSUE: No FEC generations completed")
             if 'optimal_generation_size' in packet_analysis:
                 optimal = packet_analysis['optimal_generation_size']
@@ -802,13 +1026,13 @@ def main():
                     print(f"   ✅ SOLUTION: Use generation size = 8 packets (testing)")
                     print(f"   ⏱️  Expected first generation: ~0.32 hours (19 minutes)")
         
-        elif latest['packets_recovered'] == 0:
+        elif rec == 0:
             print(f"\n⚠️  PRIMARY ISSUE: FEC not recovering packets")
             print(f"   🔧 Check recovery algorithm and redundancy settings")
         
-        elif latest['application_der_percent'] >= PAPER_TARGET_DER:
+        elif app_der >= PAPER_TARGET_DER:
             print(f"\n🎯 ALMOST THERE: FEC working but need better performance")
-            improvement_needed = PAPER_TARGET_DER / latest['application_der_percent']
+            improvement_needed = performance_analysis['target_achievement']['improvement_needed']
             print(f"   📈 Need {improvement_needed:.1f}x improvement")
             print(f"   🔧 Consider increasing redundancy or improving algorithm")
         